@@ -6,8 +6,9 @@ Create Date: 2024-07-04 15:01:48.599379
 
 """
 
-from alembic import op
+import sqlalchemy as sa
 
+from alembic import op
 
 # revision identifiers, used by Alembic.
 revision = "49f38c26141c"
@@ -17,18 +18,44 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.execute("""\
-        WITH cte AS (
-            SELECT
-                pr.*,
-                ROW_NUMBER() OVER (PARTITION BY scan_id, rule_id) AS rn
-            FROM package_rules AS pr
-        )
-        DELETE FROM package_rules
-        WHERE (scan_id, rule_id) IN (SELECT scan_id, rule_id FROM cte WHERE rn > 1)
-    """)
-
-    op.execute("ALTER TABLE package_rules ADD CONSTRAINT package_rules_pkey PRIMARY KEY (scan_id, rule_id)")
+    # Single-pass self-join on ctid. The previous window-function CTE
+    # materialized ROW_NUMBER() over the whole table and then ran a tuple-IN
+    # semijoin against it, scanning the table twice.
+    #
+    # The DELETE runs in batches inside an autocommit block, so each batch
+    # commits immediately: row locks are released and WAL is kept bounded
+    # instead of accumulating for the whole table until the ALTER TABLE below
+    # commits the migration transaction.
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        while True:
+            result = connection.execute(
+                sa.text("""\
+                    DELETE FROM package_rules
+                    WHERE ctid IN (
+                        SELECT a.ctid
+                        FROM package_rules AS a
+                        JOIN package_rules AS b
+                            ON a.scan_id = b.scan_id
+                            AND a.rule_id = b.rule_id
+                            AND a.ctid < b.ctid
+                        LIMIT 10000
+                    )
+                """)
+            )
+            if result.rowcount == 0:
+                break
+
+    # Build the unique index concurrently (no exclusive-lock sort), then
+    # promote it to the primary key. ADD CONSTRAINT ... USING INDEX only swaps
+    # catalog entries, so the exclusive lock is held for an instant instead of
+    # a full index build.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE UNIQUE INDEX CONCURRENTLY package_rules_pkey_idx ON package_rules (scan_id, rule_id)")
+
+    op.execute(
+        "ALTER TABLE package_rules ADD CONSTRAINT package_rules_pkey PRIMARY KEY USING INDEX package_rules_pkey_idx"
+    )
 
 
 def downgrade() -> None:
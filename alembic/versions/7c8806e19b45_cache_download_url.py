@@ -21,7 +21,9 @@ def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table(
         "download_urls",
-        sa.Column("id", sa.UUID(), server_default=sa.FetchedValue(), nullable=False),
+        # IDs are generated client-side by the ORM; a FetchedValue server
+        # default would make SQLAlchemy append RETURNING id to every insert.
+        sa.Column("id", sa.UUID(), nullable=False),
         sa.Column("package_id", sa.UUID(), nullable=False),
         sa.Column("url", sa.String(), nullable=False),
         sa.ForeignKeyConstraint(
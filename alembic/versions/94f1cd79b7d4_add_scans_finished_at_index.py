@@ -16,7 +16,11 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.create_index(op.f("ix_scans_finished_at"), "scans", ["finished_at"], unique=False)
+    # CREATE INDEX CONCURRENTLY builds the index without the SHARE lock a
+    # plain CREATE INDEX takes, so writes to scans keep flowing during the
+    # build. It cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scans_finished_at ON scans (finished_at)")
 
 
 def downgrade() -> None:
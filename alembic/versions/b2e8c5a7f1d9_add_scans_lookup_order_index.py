@@ -0,0 +1,28 @@
+"""add scans lookup order index
+
+Revision ID: b2e8c5a7f1d9
+Revises: f4a7e9c1d3b5
+Create Date: 2026-08-28 16:48:02.391745
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b2e8c5a7f1d9"
+down_revision = "f4a7e9c1d3b5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The package lookup orders by queued_at DESC, scan_id DESC; Postgres
+    # walks this index backwards so paginated LIMITs read rows in output
+    # order instead of sorting the whole match set.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scans_lookup_order ON scans (queued_at, scan_id)")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scans_lookup_order")
@@ -0,0 +1,37 @@
+"""add scans queue index
+
+Revision ID: d1f6b3a8c4e2
+Revises: 6991bcb18f89
+Create Date: 2026-08-28 10:12:41.310284
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d1f6b3a8c4e2"
+down_revision = "6991bcb18f89"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The job dequeue filters on status and orders by queued_at; the old
+    # single-column partial index satisfied the filter but still left a sort.
+    # The composite partial index serves both, and stays small because only
+    # queued/pending rows are indexed.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scans_queue ON scans (status, queued_at) "
+            "WHERE status = 'QUEUED' OR status = 'PENDING'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scans_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scans_status ON scans (status) "
+            "WHERE status = 'QUEUED' OR status = 'PENDING'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scans_queue")
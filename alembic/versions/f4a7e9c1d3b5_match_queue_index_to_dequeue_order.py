@@ -0,0 +1,39 @@
+"""match queue index to dequeue order
+
+Revision ID: f4a7e9c1d3b5
+Revises: d1f6b3a8c4e2
+Create Date: 2026-08-28 14:02:17.845120
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f4a7e9c1d3b5"
+down_revision = "d1f6b3a8c4e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The dequeue orders by pending_at NULLS FIRST, queued_at. ix_scans_queue
+    # led with status, so Postgres could use it for the filter but still had
+    # to sort the matches. Indexing the ORDER BY columns directly (with the
+    # same queued/pending partial predicate standing in for the status filter)
+    # lets the LIMIT walk the index in output order.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scans_queue_order "
+            "ON scans (pending_at NULLS FIRST, queued_at) "
+            "WHERE status = 'QUEUED' OR status = 'PENDING'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scans_queue")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scans_queue ON scans (status, queued_at) "
+            "WHERE status = 'QUEUED' OR status = 'PENDING'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scans_queue_order")
@@ -1,3 +1,4 @@
+import hmac
 from typing import NamedTuple
 
 from starlette.requests import Request as StarletteRequest
@@ -7,6 +8,26 @@ from mainframe.custom_exceptions import (
     RequiresAuthenticationException,
 )
 
+_BEARER_SCHEME = b"bearer"
+
+
+def _is_bearer_scheme(authorization_scheme: str) -> bool:
+    """Compare the scheme against ``bearer`` in constant time.
+
+    The header is attacker-controlled, so the comparison is done over
+    fixed-length bytes with `hmac.compare_digest` rather than a
+    short-circuiting string equality.
+    """
+    try:
+        scheme = authorization_scheme.lower().encode("ascii")
+    except UnicodeEncodeError:
+        # A valid auth-scheme is ASCII; anything else can never match, and
+        # dropping the offending bytes would let e.g. "bearerÉ" through.
+        return False
+    # Shorter schemes are padded up to length; longer ones fail the length
+    # check inside compare_digest. Only the length can leak, never a prefix.
+    return hmac.compare_digest(scheme.ljust(len(_BEARER_SCHEME), b"\0"), _BEARER_SCHEME)
+
 
 class AuthorizationHeaderElements(NamedTuple):
     authorization_scheme: str
@@ -17,13 +38,21 @@ class AuthorizationHeaderElements(NamedTuple):
 def get_authorization_header_elements(
     authorization_header: str,
 ) -> AuthorizationHeaderElements:
-    try:
-        authorization_scheme, bearer_token = authorization_header.split()
-    except ValueError:
+    # RFC 7235 credentials are "auth-scheme 1*SP token68", so runs of
+    # whitespace may separate the two; maxsplit stops the scan after the
+    # scheme instead of building a list of every field. The token68 itself
+    # may not contain whitespace, so any remaining after the split (bar
+    # trailing padding) is malformed.
+    elements = authorization_header.split(maxsplit=1)
+    if len(elements) != 2:
         raise BadCredentialsException
-    else:
-        valid = authorization_scheme.lower() == "bearer" and bool(bearer_token.strip())
-        return AuthorizationHeaderElements(authorization_scheme, bearer_token, valid)
+    authorization_scheme, bearer_token = elements
+    bearer_token = bearer_token.rstrip()
+    if len(bearer_token.split()) != 1:
+        raise BadCredentialsException
+
+    valid = _is_bearer_scheme(authorization_scheme)
+    return AuthorizationHeaderElements(authorization_scheme, bearer_token, valid)
 
 
 def get_bearer_token(request: StarletteRequest) -> str:
@@ -11,13 +11,19 @@ engine = create_engine(
     mainframe_settings.db_url,
     pool_size=mainframe_settings.db_connection_pool_persistent_size,
     max_overflow=mainframe_settings.db_connection_pool_max_size - mainframe_settings.db_connection_pool_persistent_size,
+    pool_pre_ping=True,
+    pool_recycle=mainframe_settings.db_connection_pool_recycle,
+    pool_timeout=mainframe_settings.db_connection_pool_timeout,
 )
-sessionmaker = sessionmaker(bind=engine, expire_on_commit=False, autobegin=False)
+# autobegin=False forces endpoints to scope transactions explicitly with
+# session.begin(); autoflush=False means the single flush happens at commit
+# instead of before every query issued inside the block.
+sessionmaker = sessionmaker(bind=engine, expire_on_commit=False, autobegin=False, autoflush=False)
 
 
 def get_db() -> Generator[Session, None, None]:
-    session = sessionmaker()
-    try:
+    # The context manager rolls back any transaction left open by a failed
+    # request before closing, so connections go back to the pool clean instead
+    # of paying a reset round-trip on their next checkout.
+    with sessionmaker() as session:
         yield session
-    finally:
-        session.close()
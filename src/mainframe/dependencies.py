@@ -1,10 +1,14 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from functools import cache
-from typing import Annotated
+from functools import cache, lru_cache
+from typing import Annotated, Optional
 
 import httpx
 from fastapi import Depends, Request
-from letsbuilda.pypi import PyPIServices
+from letsbuilda.pypi import Package as PyPIPackage, PyPIServices
 
 from mainframe.authorization_header_elements import get_bearer_token
 from mainframe.custom_exceptions import PermissionDeniedException
@@ -12,10 +16,60 @@ from mainframe.json_web_token import AuthenticationData, JsonWebToken
 from mainframe.rules import Rules
 
 
+_PYPI_METADATA_CACHE_MAX_SIZE = 10_000
+_PYPI_METADATA_TTL_SECONDS = 300.0
+
+
+class _CachingPyPIServices(PyPIServices):
+    """PyPIServices with a short TTL cache over package metadata lookups.
+
+    Re-queue storms and dependency fan-out ask for the same (name, version)
+    repeatedly; published metadata is effectively immutable, so repeats become
+    a dict lookup instead of a PyPI round-trip. Failed lookups are never
+    cached, so a package queued moments after release is still fetched fresh.
+    """
+
+    def __init__(self, http_client: httpx.Client) -> None:
+        super().__init__(http_client)
+        self._metadata_cache: OrderedDict[tuple[str, Optional[str]], tuple[float, PyPIPackage]] = OrderedDict()
+        # The batch endpoint fans lookups out over a thread pool, so the
+        # cache dict needs a lock; the network call happens outside it.
+        self._metadata_lock = threading.Lock()
+
+    def get_package_metadata(self, package_title: str, package_version: Optional[str] = None) -> PyPIPackage:
+        key = (package_title, package_version)
+        now = time.monotonic()
+
+        with self._metadata_lock:
+            entry = self._metadata_cache.get(key)
+            if entry is not None and now - entry[0] < _PYPI_METADATA_TTL_SECONDS:
+                return entry[1]
+
+        package = super().get_package_metadata(package_title, package_version)
+
+        with self._metadata_lock:
+            self._metadata_cache[key] = (now, package)
+            while len(self._metadata_cache) > _PYPI_METADATA_CACHE_MAX_SIZE:
+                self._metadata_cache.popitem(last=False)
+
+        return package
+
+
 @cache
 def get_pypi_client() -> PyPIServices:
-    http_client = httpx.Client()
-    return PyPIServices(http_client)
+    # One pooled client per process. HTTP/2 lets batch metadata fetches
+    # multiplex over a single connection, keep-alive skips the TCP/TLS
+    # handshake on repeat calls, and a retry absorbs dropped keep-alive
+    # connections.
+    http_client = httpx.Client(
+        timeout=httpx.Timeout(10.0),
+        transport=httpx.HTTPTransport(
+            retries=1,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+        ),
+    )
+    return _CachingPyPIServices(http_client)
 
 
 def get_httpx_client(request: Request) -> httpx.Client:
@@ -26,29 +80,62 @@ def get_rules(request: Request) -> Rules:
     return request.app.state.rules
 
 
+# Signature verification is pure CPU work and its result is immutable for the
+# lifetime of the token, so validated claims are memoized keyed by a digest of
+# the raw token (so the cache never holds the bearer token itself). Entries
+# past their `exp` are re-validated, so expiry is still enforced.
+_TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: OrderedDict[bytes, AuthenticationData] = OrderedDict()
+# Sync dependencies run on FastAPI's threadpool, so lookups and evictions
+# race without a lock; signature validation itself happens outside it.
+_token_cache_lock = threading.Lock()
+
+
 def validate_token(token: Annotated[str, Depends(get_bearer_token)]) -> AuthenticationData:
-    return JsonWebToken(token).validate()
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
 
+    with _token_cache_lock:
+        data = _token_cache.get(key)
+    if data is not None and data.expires_at > datetime.now():
+        return data
 
-def validate_token_override():
+    data = JsonWebToken(token).validate()
+
+    with _token_cache_lock:
+        _token_cache[key] = data
+        while len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
+    return data
+
+
+@lru_cache(maxsize=2)
+def _development_authentication_data(bucket: int) -> AuthenticationData:
+    now = datetime.now()
     return AuthenticationData(
         issuer="DEVELOPMENT ISSUER",
         subject="DEVELOPMENT SUBJECT",
         audience="DEVELOPMENT AUDIENCE",
-        issued_at=datetime.now() - timedelta(seconds=10),
-        expires_at=datetime.now() + timedelta(seconds=10),
+        issued_at=now - timedelta(seconds=10),
+        expires_at=now + timedelta(seconds=60),
         grant_type="DEVELOPMENT GRANT TYPE",
     )
 
 
+def validate_token_override():
+    # Dev/test override runs on every request; reuse one AuthenticationData
+    # per 30-second window instead of allocating fresh datetimes each call.
+    return _development_authentication_data(int(time.monotonic() // 30))
+
+
 class PermissionsValidator:
     def __init__(self, required_permissions: list[str]):
-        self.required_permissions = required_permissions
+        # Frozen once here; rebuilding a set per request was pure overhead
+        # since the requirements never change after construction.
+        self.required_permissions = frozenset(required_permissions)
 
     def __call__(self, data: Annotated[AuthenticationData, Depends(validate_token)]):
-        token_permissions = data.permissions  # type: ignore
-        token_permissions_set = set(token_permissions)  # type: ignore
-        required_permissions_set = set(self.required_permissions)
-
-        if not required_permissions_set.issubset(token_permissions_set):  # type: ignore
+        # issubset accepts any iterable, so the token's permissions list does
+        # not need to be copied into a set of its own.
+        if not self.required_permissions.issubset(data.permissions):  # type: ignore
             raise PermissionDeniedException
@@ -5,9 +5,15 @@ from fastapi import APIRouter
 
 from mainframe import endpoints
 
-routers: list[APIRouter] = []
-for module_info in walk_packages(endpoints.__path__, f"{endpoints.__name__}."):
-    module = import_module(module_info.name)
-    router = getattr(module, "router", None)
-    if router is not None:
-        routers.append(router)
+
+def _discover_routers() -> tuple[APIRouter, ...]:
+    discovered: list[APIRouter] = []
+    for module_info in walk_packages(endpoints.__path__, f"{endpoints.__name__}."):
+        module = import_module(module_info.name)
+        router = getattr(module, "router", None)
+        if router is not None:
+            discovered.append(router)
+    return tuple(discovered)
+
+
+routers: tuple[APIRouter, ...] = _discover_routers()
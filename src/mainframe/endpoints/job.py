@@ -2,7 +2,7 @@ from typing import Annotated
 
 import structlog
 from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from sqlalchemy import Integer, bindparam, select
 from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy.sql.expression import text
 
@@ -17,41 +17,28 @@ from mainframe.rules import Rules
 router = APIRouter(tags=["job"])
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
+# Every log line in this module carries the same tag; binding it once here
+# saves rebuilding the bound-logger context dict per job handed out.
+_job_given_logger = logger.bind(tag="job_given")
 
-@router.post("/jobs")
-def get_jobs(
-    session: Annotated[Session, Depends(get_db)],
-    auth: Annotated[AuthenticationData, Depends(validate_token)],
-    state: Annotated[Rules, Depends(get_rules)],
-    batch: int = 1,
-) -> list[JobResult]:
-    """
-    Request one or more releases to work on.
-
-    Clients can specify the number of jobs they want to be given
-    using the `batch` query string parameter. If omitted, it defaults
-    to `1`.
-
-    Clients are assigned the oldest release in the queue, i.e., the release
-    with the oldest `queued_at` time.
-
-    We also consider releases with a `pending_at` older than
-    `now() - JOB_TIMEOUT` to be queued at the current time. This way, timed out
-    packages are always processed after newly queued packages.
-    """
 
-    # See positional column targeting
-    # https://docs.sqlalchemy.org/en/20/core/sqlelement.html#sqlalchemy.sql.expression.TextClause.columns
-    # Query overview:
-    # 1. select valid jobs and lock them
-    # 2. update their status to pending
-    # 3. select the updated rows and join download urls
-    #
-    # We need 2 CTEs because we need to LIMIT before joining the download urls.
-    # If we were to join in the update, we will only get one of the download
-    # urls for each scan, since Postgres will try to optimize and only update
-    # one row, which will only return one download url.
-    stmt = text("""\
+# See positional column targeting
+# https://docs.sqlalchemy.org/en/20/core/sqlelement.html#sqlalchemy.sql.expression.TextClause.columns
+# Query overview:
+# 1. select valid jobs and lock them
+# 2. update their status to pending
+# 3. select the updated rows and join download urls
+#
+# We need 2 CTEs because we need to LIMIT before joining the download urls.
+# If we were to join in the update, we will only get one of the download
+# urls for each scan, since Postgres will try to optimize and only update
+# one row, which will only return one download url.
+#
+# Built at module scope so each request reuses the same statement object and
+# SQLAlchemy's compiled cache is hit by identity instead of rebuilding and
+# rehashing the expression per call.
+_JOBS_STMT = (
+    text("""\
 WITH packages AS (
     SELECT
         scans.scan_id,
@@ -66,7 +53,7 @@ WITH packages AS (
         scans.status = 'QUEUED'
         OR (
             scans.status = 'PENDING'
-            AND scans.pending_at < CURRENT_TIMESTAMP - INTERVAL ':job_timeout'
+            AND scans.pending_at < CURRENT_TIMESTAMP - make_interval(secs => :job_timeout)
         )
     ORDER BY scans.pending_at NULLS FIRST, scans.queued_at
     LIMIT :batch
@@ -95,7 +82,14 @@ SELECT
     updated.pending_at
 FROM updated
 LEFT JOIN download_urls ON download_urls.scan_id = updated.scan_id
-""").columns(
+""")
+    .bindparams(
+        # Typed so the driver sends integers and Postgres caches a single plan
+        # across batch sizes and timeout settings.
+        bindparam("job_timeout", type_=Integer),
+        bindparam("batch", type_=Integer),
+    )
+    .columns(
         DownloadURL.id,
         DownloadURL.scan_id,
         DownloadURL.url,
@@ -107,20 +101,49 @@ LEFT JOIN download_urls ON download_urls.scan_id = updated.scan_id
         Scan.queued_by,
         Scan.pending_at,
     )
+)
+
+_JOBS_QUERY = select(Scan).from_statement(_JOBS_STMT).options(contains_eager(Scan.download_urls))
+
+
+@router.post("/jobs")
+def get_jobs(
+    session: Annotated[Session, Depends(get_db)],
+    auth: Annotated[AuthenticationData, Depends(validate_token)],
+    state: Annotated[Rules, Depends(get_rules)],
+    batch: int = 1,
+) -> list[JobResult]:
+    """
+    Request one or more releases to work on.
+
+    Clients can specify the number of jobs they want to be given
+    using the `batch` query string parameter. If omitted, it defaults
+    to `1`.
+
+    Clients are assigned the oldest release in the queue, i.e., the release
+    with the oldest `queued_at` time.
+
+    We also consider releases with a `pending_at` older than
+    `now() - JOB_TIMEOUT` to be queued at the current time. This way, timed out
+    packages are always processed after newly queued packages.
+    """
 
-    query = select(Scan).from_statement(stmt).options(contains_eager(Scan.download_urls))
     with session as s, s.begin():
         scans = (
             session.scalars(
-                query, params=dict(job_timeout=mainframe_settings.job_timeout, batch=batch, pending_by=auth.subject)
+                _JOBS_QUERY,
+                params=dict(job_timeout=mainframe_settings.job_timeout, batch=batch, pending_by=auth.subject),
             )
             .unique()
             .all()
         )
 
+    # Resolved once; the commit hash is the same for every job in the batch.
+    rules_commit = state.rules_commit
+
     response_body: list[JobResult] = []
     for scan in scans:
-        logger.info(
+        _job_given_logger.info(
             "Job given and status set to pending in database",
             package={
                 "name": scan.name,
@@ -129,14 +152,15 @@ LEFT JOIN download_urls ON download_urls.scan_id = updated.scan_id
                 "pending_by": auth.subject,
                 "version": scan.version,
             },
-            tag="job_given",
         )
 
-        job_result = JobResult(
+        # model_construct skips pydantic validation; every field here comes
+        # straight from our own typed columns, so there is nothing to coerce.
+        job_result = JobResult.model_construct(
             name=scan.name,
             version=scan.version,
             distributions=[dist.url for dist in scan.download_urls],
-            hash=state.rules_commit,
+            hash=rules_commit,
         )
 
         response_body.append(job_result)
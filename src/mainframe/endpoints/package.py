@@ -1,5 +1,6 @@
 from collections.abc import Iterable, Sequence
 import datetime as dt
+import uuid
 from typing import Annotated, Optional
 
 import structlog
@@ -8,15 +9,16 @@ from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate  # type: ignore
 from letsbuilda.pypi import Package as PyPIPackage, PyPIServices  # type: ignore
 from letsbuilda.pypi.exceptions import PackageNotFoundError
-from sqlalchemy import select, tuple_
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from concurrent.futures import ThreadPoolExecutor
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 
 from mainframe.database import get_db
 from mainframe.dependencies import get_pypi_client, validate_token
 from mainframe.json_web_token import AuthenticationData
-from mainframe.models.orm import DownloadURL, Rule, Scan, Status
+from mainframe.models.orm import DownloadURL, Rule, Scan, Status, package_rules
 from mainframe.models.schemas import (
     Error,
     Package,
@@ -47,35 +49,35 @@ def submit_results(
     name = result.name
     version = result.version
 
-    with session.begin():
-        scan = session.scalar(
-            select(Scan).where(Scan.name == name).where(Scan.version == version).options(joinedload(Scan.rules))
-        )
-
     log = logger.bind(package={"name": name, "version": version})
 
-    if scan is None:
-        error = HTTPException(404, f"Package `{name}@{version}` not found in database.")
-        log.error(
-            f"Package {name}@{version} not found in database", error_message=error.detail, tag="package_not_found_db"
-        )
-        raise error
+    # One transaction for the lookup, the status check and the update. The
+    # previous two-transaction version cost an extra commit round-trip and
+    # left a window where two clients could both see a non-FINISHED scan.
+    with session, session.begin():
+        scan = session.scalar(select(Scan).where(Scan.name == name).where(Scan.version == version))
+
+        if scan is None:
+            error = HTTPException(404, f"Package `{name}@{version}` not found in database.")
+            log.error(
+                f"Package {name}@{version} not found in database",
+                error_message=error.detail,
+                tag="package_not_found_db",
+            )
+            raise error
 
-    if scan.status == Status.FINISHED:
-        error = HTTPException(409, f"Package `{name}@{version}` is already in a FINISHED state.")
-        log.error(
-            f"Scan {name}@{version} already in a FINISHED state", error_message=error.detail, tag="already_finished"
-        )
-        packages_in_queue.dec()
-        raise error
+        if scan.status == Status.FINISHED:
+            error = HTTPException(409, f"Package `{name}@{version}` is already in a FINISHED state.")
+            log.error(
+                f"Scan {name}@{version} already in a FINISHED state", error_message=error.detail, tag="already_finished"
+            )
+            packages_in_queue.dec()
+            raise error
 
-    with session, session.begin():
         if isinstance(result, PackageScanResultFail):
             scan.status = Status.FAILED
             scan.fail_reason = result.reason
 
-            session.commit()
-
             packages_fail.inc()
             packages_in_queue.dec()
 
@@ -88,14 +90,29 @@ def submit_results(
         scan.finished_by = auth.subject
         scan.commit_hash = result.commit
 
-        # These are the rules that already have an entry in the database
-        rules = session.scalars(select(Rule).where(Rule.name.in_(result.rules_matched))).all()
-        rule_names = {rule.name for rule in rules}
-        scan.rules.extend(rules)
-
-        # These are the rules that had to be created
-        new_rules = [Rule(name=rule_name) for rule_name in result.rules_matched if rule_name not in rule_names]
-        scan.rules.extend(new_rules)
+        # Create-or-ignore every matched rule in one round-trip, then link the
+        # full set through the association table directly. The previous
+        # SELECT-then-append raced concurrent submitters on rule creation and
+        # flushed one INSERT per new rule.
+        matched_names = set(result.rules_matched)
+        created_names: Sequence[str] = []
+        if matched_names:
+            created_names = (
+                session.execute(
+                    pg_insert(Rule)
+                    .values([dict(id=uuid.uuid4(), name=rule_name) for rule_name in matched_names])
+                    .on_conflict_do_nothing(index_elements=["name"])
+                    .returning(Rule.name)
+                )
+                .scalars()
+                .all()
+            )
+            rules = session.scalars(select(Rule).where(Rule.name.in_(matched_names))).all()
+            session.execute(
+                pg_insert(package_rules)
+                .values([dict(scan_id=scan.scan_id, rule_id=rule.id) for rule in rules])
+                .on_conflict_do_nothing()
+            )
 
     log.info(
         "Scan results submitted",
@@ -107,8 +124,8 @@ def submit_results(
             "inspector_url": result.inspector_url,
             "score": result.score,
             "finished_by": auth.subject,
-            "existing_rules": rule_names,
-            "created_rules": [rule.name for rule in new_rules],
+            "existing_rules": sorted(matched_names - set(created_names)),
+            "created_rules": sorted(created_names),
         },
         tag="scan_submitted",
     )
@@ -173,7 +190,17 @@ def lookup_package_info(
         )
         raise HTTPException(status_code=400)
 
-    query = select(Scan).order_by(Scan.queued_at.desc()).options(joinedload(Scan.rules), joinedload(Scan.download_urls))
+    # selectinload over joinedload here: joining two collections multiplies
+    # rows (rules x download_urls per scan), and a joined collection breaks
+    # the LIMIT that pagination applies. Two extra IN queries load both flat.
+    # scan_id breaks ties between scans queued in the same instant, so page
+    # boundaries are stable across requests instead of shifting with the
+    # planner's row order.
+    query = (
+        select(Scan)
+        .order_by(Scan.queued_at.desc(), Scan.scan_id.desc())
+        .options(selectinload(Scan.rules), selectinload(Scan.download_urls))
+    )
     if nn_name:
         query = query.where(Scan.name == name)
     if nn_version:
@@ -187,7 +214,7 @@ def lookup_package_info(
             return paginate(
                 session, query, params=params, transformer=lambda items: [Package.from_db(item) for item in items]
             )
-        data = session.scalars(query).unique()
+        data = session.scalars(query)
         return [Package.from_db(result) for result in data]
 
 
@@ -197,6 +224,12 @@ def _deduplicate_packages(packages: list[PackageSpecifier], session: Session) ->
     return name_ver - {(scan.name, scan.version) for scan in scalars.all()}
 
 
+# Shared across requests so we don't pay thread spawn and teardown per batch,
+# and bounded so one large batch can't open an unlimited number of outbound
+# connections to PyPI at once.
+_metadata_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="pypi-metadata")
+
+
 def _get_packages_metadata(pypi_client: PyPIServices, packages_to_check: set[tuple[str, str]]) -> Iterable[PyPIPackage]:
     if not packages_to_check:
         return
@@ -207,11 +240,7 @@ def _get_packages_metadata(pypi_client: PyPIServices, packages_to_check: set[tup
         except PackageNotFoundError:
             return
 
-    # IO-bound, so these threads won't take up much CPU. Just spawn as many as
-    # we need to send all requests at once. We avoid the
-    # `len(packages_to_check) == 0` case by returning early above
-    with ThreadPoolExecutor(max_workers=len(packages_to_check)) as tpe:
-        yield from filter(None, tpe.map(_get_package_metadata, packages_to_check))
+    yield from filter(None, _metadata_executor.map(_get_package_metadata, packages_to_check))
 
 
 @router.post(
@@ -230,21 +259,52 @@ def batch_queue_package(
     with session, session.begin():
         packages_to_check = _deduplicate_packages(packages, session)
 
+        # Two multi-row INSERTs instead of one per scan plus one per download
+        # URL. The ids and timestamps are generated here because the dataclass
+        # default factories only run for ORM instances, not Core inserts.
+        queued_at = dt.datetime.now(dt.timezone.utc)
+        distributions: dict[tuple[str, str], list[str]] = {}
+        scan_rows: list[dict[str, object]] = []
         for package_metadata in _get_packages_metadata(pypi_client, packages_to_check):
-            scan = Scan(
-                name=package_metadata.title,
-                version=package_metadata.releases[0].version,
-                status=Status.QUEUED,
-                queued_by=auth.subject,
-                download_urls=[
-                    DownloadURL(url=distribution.url) for distribution in package_metadata.releases[0].distributions
-                ],
+            name = package_metadata.title
+            version = package_metadata.releases[0].version
+            distributions[(name, version)] = [
+                distribution.url for distribution in package_metadata.releases[0].distributions
+            ]
+            scan_rows.append(
+                dict(
+                    scan_id=uuid.uuid4(),
+                    name=name,
+                    version=version,
+                    status=Status.QUEUED,
+                    queued_at=queued_at,
+                    queued_by=auth.subject,
+                )
             )
 
-            session.add(scan)
+        if not scan_rows:
+            return
 
-            packages_ingested.inc()
-            packages_in_queue.inc()
+        # ON CONFLICT DO NOTHING covers the race where the same package is
+        # queued concurrently between our dedup SELECT and this INSERT; only
+        # rows we actually inserted come back, so skipped ones get no URLs.
+        inserted = session.execute(
+            pg_insert(Scan)
+            .values(scan_rows)
+            .on_conflict_do_nothing(index_elements=["name", "version"])
+            .returning(Scan.scan_id, Scan.name, Scan.version)
+        ).all()
+
+        url_rows = [
+            dict(id=uuid.uuid4(), scan_id=scan_id, url=url)
+            for scan_id, name, version in inserted
+            for url in distributions[(name, version)]
+        ]
+        if url_rows:
+            session.execute(insert(DownloadURL).values(url_rows))
+
+        packages_ingested.inc(len(inserted))
+        packages_in_queue.inc(len(inserted))
 
 
 @router.post(
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from functools import cache
+from typing import Any, ClassVar, Optional
 
 import jwt
 
@@ -32,6 +33,17 @@ class AuthenticationData:
         )
 
 
+@cache
+def _get_jwks_client(jwks_uri: str) -> jwt.PyJWKClient:
+    """One PyJWKClient per JWKS URI for the life of the process.
+
+    Constructing the client per validation threw away PyJWKClient's built-in
+    JWK set cache, re-fetching the JWKS over HTTPS whenever a token missed the
+    claims cache. cache_keys additionally memoizes parsed signing keys.
+    """
+    return jwt.PyJWKClient(jwks_uri, cache_keys=True)
+
+
 @dataclass
 class JsonWebToken:
     """Perform JSON Web Token (JWT) validation using PyJWT"""
@@ -39,17 +51,19 @@ class JsonWebToken:
     jwt_access_token: str
     auth0_issuer_url: str = f"https://{mainframe_settings.auth0_domain}/"
     auth0_audience: str = mainframe_settings.auth0_audience
-    algorithm: str = "RS256"
     jwks_uri: str = f"{auth0_issuer_url}.well-known/jwks.json"
 
+    # Built once so PyJWT is not handed a freshly-allocated list per decode.
+    _ALGORITHMS: ClassVar[list[str]] = ["RS256"]
+
     def validate(self) -> AuthenticationData:
         try:
-            jwks_client = jwt.PyJWKClient(self.jwks_uri)
+            jwks_client = _get_jwks_client(self.jwks_uri)
             jwt_signing_key = jwks_client.get_signing_key_from_jwt(self.jwt_access_token).key
             payload = jwt.decode(  # type: ignore
                 self.jwt_access_token,
                 jwt_signing_key,
-                algorithms=self.algorithm,  # type: ignore
+                algorithms=self._ALGORITHMS,
                 audience=self.auth0_audience,
                 issuer=self.auth0_issuer_url,
             )
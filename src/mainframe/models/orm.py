@@ -100,7 +100,18 @@ class Scan(Base):
     commit_hash: Mapped[Optional[str]] = mapped_column(default=None)
 
 
-Index(None, Scan.status, postgresql_where=or_(Scan.status == Status.QUEUED, Scan.status == Status.PENDING))
+# Matches the ORDER BY of the /jobs dequeue so the LIMIT walks the index in
+# output order; the partial predicate keeps it to the queued/pending rows.
+Index(
+    "ix_scans_queue_order",
+    Scan.pending_at.nullsfirst(),
+    Scan.queued_at,
+    postgresql_where=or_(Scan.status == Status.QUEUED, Scan.status == Status.PENDING),
+)
+
+# Matches the (queued_at, scan_id) ordering of the package lookup, scanned
+# backwards for the DESC pages, so LIMIT reads rows in output order.
+Index("ix_scans_lookup_order", Scan.queued_at, Scan.scan_id)
 
 
 class DownloadURL(Base):
@@ -8,15 +8,17 @@ import httpx
 import sentry_sdk
 from asgi_correlation_id import CorrelationIdMiddleware, correlation_id
 from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi_pagination import add_pagination
-from letsbuilda.pypi import PyPIServices
 from sentry_sdk.integrations.logging import LoggingIntegration
+from sqlalchemy import text
 from structlog_sentry import SentryProcessor
 from logging_config import configure_logger
 from logging_config.middleware import LoggingMiddleware
 
 from mainframe.constants import GIT_SHA, Sentry, mainframe_settings
-from mainframe.dependencies import validate_token, validate_token_override
+from mainframe.database import engine
+from mainframe.dependencies import get_pypi_client, validate_token, validate_token_override
 from mainframe.endpoints import routers
 from mainframe.models.schemas import ServerMetadata
 from mainframe.rules import Rules, fetch_rules
@@ -56,7 +58,9 @@ async def lifespan(app_: FastAPI):
     """Load the state for the app"""
 
     http_client = httpx.Client()
-    pypi_client = PyPIServices(http_client)
+    # The same pooled client instance the get_pypi_client dependency hands
+    # out, so the whole process shares one keep-alive pool to PyPI.
+    pypi_client = get_pypi_client()
     rules = fetch_rules(http_client)
 
     app_.state.rules = rules
@@ -65,14 +69,26 @@ async def lifespan(app_: FastAPI):
 
     setup_logging()
 
+    # Fill the persistent pool up front so the first requests don't pay for
+    # TCP/TLS and authentication handshakes. The connections are checked out
+    # together (then released) to force distinct ones to be created.
+    warmup_connections = [engine.connect() for _ in range(mainframe_settings.db_connection_pool_persistent_size)]
+    for connection in warmup_connections:
+        connection.execute(text("SELECT 1"))
+        connection.close()
+
     yield
 
+    http_client.close()
+    engine.dispose()
+
 
 app = FastAPI(
     lifespan=lifespan,
     title="Mainframe",
     description="A service that provides a REST API for managing rules.",
     version=__version__,
+    default_response_class=ORJSONResponse,
 )
 
 Instrumentator().instrument(app).expose(app)
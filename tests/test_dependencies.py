@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from typing import Optional, cast
+from unittest.mock import Mock
+
+import httpx
+from letsbuilda.pypi import Package, PyPIServices
+from pytest import MonkeyPatch
+
+from mainframe import dependencies
+from mainframe.dependencies import _PYPI_METADATA_TTL_SECONDS  # pyright: ignore [reportPrivateUsage]
+from mainframe.dependencies import _CachingPyPIServices  # pyright: ignore [reportPrivateUsage]
+from mainframe.json_web_token import AuthenticationData, JsonWebToken
+
+
+def _fake_validate(calls: list[str]):
+    def validate(self: JsonWebToken) -> AuthenticationData:
+        calls.append(self.jwt_access_token)
+        now = datetime.now()
+        return AuthenticationData(
+            issuer="TEST ISSUER",
+            subject="TEST SUBJECT",
+            audience="TEST AUDIENCE",
+            issued_at=now,
+            expires_at=now + timedelta(seconds=60),
+            grant_type=None,
+        )
+
+    return validate
+
+
+def test_validate_token_cache_expiry(monkeypatch: MonkeyPatch):
+    calls: list[str] = []
+    monkeypatch.setattr(JsonWebToken, "validate", _fake_validate(calls))
+    monkeypatch.setattr(dependencies, "_token_cache", dependencies._token_cache.__class__())
+
+    data = dependencies.validate_token("test.token")
+    assert dependencies.validate_token("test.token") is data
+    assert calls == ["test.token"]
+
+    # An entry past its exp must be re-validated, not served from the cache
+    data.expires_at = datetime.now() - timedelta(seconds=1)
+    assert dependencies.validate_token("test.token") is not data
+    assert calls == ["test.token", "test.token"]
+
+
+def test_validate_token_cache_eviction(monkeypatch: MonkeyPatch):
+    calls: list[str] = []
+    monkeypatch.setattr(JsonWebToken, "validate", _fake_validate(calls))
+    monkeypatch.setattr(dependencies, "_token_cache", dependencies._token_cache.__class__())
+    monkeypatch.setattr(dependencies, "_TOKEN_CACHE_MAX_SIZE", 2)
+
+    for token in ["token.a", "token.b", "token.c"]:
+        dependencies.validate_token(token)
+    assert len(dependencies._token_cache) == 2
+
+    # The oldest entry was evicted, so it validates again; the newest did not
+    dependencies.validate_token("token.a")
+    dependencies.validate_token("token.c")
+    assert calls == ["token.a", "token.b", "token.c", "token.a"]
+
+
+def test_pypi_metadata_cache_ttl(monkeypatch: MonkeyPatch):
+    calls: list[tuple[str, Optional[str]]] = []
+
+    def fake_metadata(self: PyPIServices, package_title: str, package_version: Optional[str] = None) -> Package:
+        calls.append((package_title, package_version))
+        return cast(Package, Mock(spec=Package))
+
+    monkeypatch.setattr(PyPIServices, "get_package_metadata", fake_metadata)
+    client = _CachingPyPIServices(cast(httpx.Client, Mock(spec=httpx.Client)))
+
+    package = client.get_package_metadata("a", "1.0.0")
+    assert client.get_package_metadata("a", "1.0.0") is package
+    assert calls == [("a", "1.0.0")]
+
+    # Age the entry past the TTL; the next lookup must go back to PyPI
+    cached_at, cached = client._metadata_cache[("a", "1.0.0")]  # pyright: ignore [reportPrivateUsage]
+    client._metadata_cache[("a", "1.0.0")] = (  # pyright: ignore [reportPrivateUsage]
+        cached_at - _PYPI_METADATA_TTL_SECONDS - 1,
+        cached,
+    )
+    client.get_package_metadata("a", "1.0.0")
+    assert calls == [("a", "1.0.0"), ("a", "1.0.0")]
@@ -5,6 +5,8 @@ from zipfile import ZipFile
 
 from pytest import MonkeyPatch
 
+from mainframe.constants import mainframe_settings
+
 from mainframe.endpoints.rules import get_rules
 from mainframe.rules import (
     Rules,
@@ -84,7 +86,12 @@ def test_fetch_rules(monkeypatch: MonkeyPatch):
     for filename, contents in files.items():
         zip.writestr(filename + ".yara", contents)
 
-    monkeypatch.setattr("mainframe.constants.mainframe_settings.dragonfly_github_token", "token")
+    # The settings model is frozen, so swap in an updated copy instead of
+    # mutating the shared instance
+    monkeypatch.setattr(
+        "mainframe.rules.mainframe_settings",
+        mainframe_settings.model_copy(update={"dragonfly_github_token": "token"}),
+    )
     monkeypatch.setattr("mainframe.rules.fetch_commit_hash", Mock(return_value="test commit hash"))
     monkeypatch.setattr("mainframe.rules.fetch_zipfile", Mock(return_value=zip))
 